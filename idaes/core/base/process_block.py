@@ -164,13 +164,23 @@ class ProcessBlock(Block):
             # that is neither indexed or scalar so you go to the if below and
             # create an index or scalar subclass of cls.
             return super(Block, cls).__new__(cls)
+        # The derived scalar and indexed classes depend only on cls, so they
+        # are memoized on cls itself rather than synthesized per instance.
+        # Look-ups use cls.__dict__ to avoid picking up a class cached on a
+        # parent ProcessBlock subclass.
         if args == ():  # no args so make scalar class
-            bname = "_Scalar{}".format(cls.__name__)
-            n = _ScalarProcessBlockMeta(bname, (cls._ComponentDataClass, cls), {})
+            n = cls.__dict__.get("_scalar_process_block_class", None)
+            if n is None:
+                bname = "_Scalar{}".format(cls.__name__)
+                n = _ScalarProcessBlockMeta(bname, (cls._ComponentDataClass, cls), {})
+                cls._scalar_process_block_class = n
             return n.__new__(n)  # calls this __new__() again with scalar class
         else:  # args so make indexed class
-            bname = "_Indexed{}".format(cls.__name__)
-            n = _IndexedProcessBlockMeta(bname, (cls,), {})
+            n = cls.__dict__.get("_indexed_process_block_class", None)
+            if n is None:
+                bname = "_Indexed{}".format(cls.__name__)
+                n = _IndexedProcessBlockMeta(bname, (cls,), {})
+                cls._indexed_process_block_class = n
             return n.__new__(n)  # calls this __new__() again with indexed class
 
 
@@ -42,6 +42,27 @@ class _Flowsheet(FlowsheetBlockData):
         super(FlowsheetBlockData, self).build()
 
 
+@pytest.fixture(scope="module")
+def base_fs_ss():
+    # Shared steady-state flowsheet for tests which do not mutate the model.
+    # Tests which need to add components should clone this instead.
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock()
+    m.fs.props = PhysicalParameterTestBlock()
+
+    return m
+
+
+@pytest.fixture(scope="module")
+def validation_model():
+    # ConfigBlock validation raises before mutating the config, so a single
+    # model can be shared across all the invalid-value cases.
+    m = ConcreteModel()
+    m.fs = Flowsheet()
+
+    return m
+
+
 class TestConfig(object):
     @pytest.fixture()
     def model(self):
@@ -61,27 +82,16 @@ class TestConfig(object):
 
     @pytest.mark.unit
     def test_config_validation_dynamic(self, model):
-        # Test validation of dynamic argument
+        # Test validation of dynamic argument - valid values
         model.fs.config.dynamic = False
         assert model.fs.config.dynamic is False
 
         model.fs.config.dynamic = True
         assert model.fs.config.dynamic is True
 
-        with pytest.raises(ValueError):
-            model.fs.config.dynamic = "foo"
-        with pytest.raises(ValueError):
-            model.fs.config.dynamic = 2
-        with pytest.raises(ValueError):
-            model.fs.config.dynamic = 2.0
-        with pytest.raises(ValueError):
-            model.fs.config.dynamic = [1]
-        with pytest.raises(ValueError):
-            model.fs.config.dynamic = {"foo": 1}
-
     @pytest.mark.unit
     def test_config_validation_time(self, model):
-        # Test validation of time argument
+        # Test validation of time argument - valid values
         model.test_set = Set(initialize=[0, 1, 2])
         model.test_contset = ContinuousSet(bounds=[0, 1])
 
@@ -91,20 +101,9 @@ class TestConfig(object):
         model.fs.config.time = model.test_contset
         assert model.fs.config.time == model.test_contset
 
-        with pytest.raises(ValueError):
-            model.fs.config.time = "foo"
-        with pytest.raises(ValueError):
-            model.fs.config.time = 1
-        with pytest.raises(ValueError):
-            model.fs.config.time = 2.0
-        with pytest.raises(ValueError):
-            model.fs.config.time = [1]
-        with pytest.raises(ValueError):
-            model.fs.config.time = {"foo": 1}
-
     @pytest.mark.unit
     def test_config_validation_time_set(self, model):
-        # Test validation of time_set argument
+        # Test validation of time_set argument - valid values
         model.fs.config.time_set = [1, 2, 3]
         assert model.fs.config.time_set == [1, 2, 3]
         model.fs.config.time_set = 5
@@ -112,54 +111,61 @@ class TestConfig(object):
         model.fs.config.time_set = 2.0
         assert model.fs.config.time_set == [2.0]
 
-        with pytest.raises(ValueError):
-            model.fs.config.time_set = "foo"  # invalid str
-        with pytest.raises(ValueError):
-            model.fs.config.time_set = {"a": 2.0}  # invalid dict
-
     @pytest.mark.unit
     def test_config_validation_default_property_package(self, model):
-        # Test default_property_package attribute
+        # Test default_property_package attribute - valid values
         model.fs.p = PhysicalParameterTestBlock()
 
         model.fs.config.default_property_package = model.fs.p
 
-        # Test default_property_package - invalid values
-        with pytest.raises(ValueError):
-            model.fs.config.default_property_package = "foo"  # invalid str
-        with pytest.raises(ValueError):
-            model.fs.config.default_property_package = 5  # invalid int
-        with pytest.raises(ValueError):
-            model.fs.config.default_property_package = 2.0  # invalid float
-        with pytest.raises(ValueError):
-            model.fs.config.default_property_package = [2.0]  # invalid list
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "attr,bad",
+        [
+            ("dynamic", "foo"),
+            ("dynamic", 2),
+            ("dynamic", 2.0),
+            ("dynamic", [1]),
+            ("dynamic", {"foo": 1}),
+            ("time", "foo"),
+            ("time", 1),
+            ("time", 2.0),
+            ("time", [1]),
+            ("time", {"foo": 1}),
+            ("time_set", "foo"),
+            ("time_set", {"a": 2.0}),
+            ("default_property_package", "foo"),
+            ("default_property_package", 5),
+            ("default_property_package", 2.0),
+            ("default_property_package", [2.0]),
+            ("default_property_package", {"a": 2.0}),
+        ],
+    )
+    def test_config_validation_invalid(self, validation_model, attr, bad):
         with pytest.raises(ValueError):
-            model.fs.config.default_property_package = {"a": 2.0}  # invalid dict
+            setattr(validation_model.fs.config, attr, bad)
 
 
 class TestBuild(object):
     # Test that build method works for all combinations of config arguments
     @pytest.mark.unit
-    def test_is_flowsheet(self):
+    def test_is_flowsheet(self, base_fs_ss):
         # Test that flowsheet has is_flowsheet method and that it returns True
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock()
+        m = base_fs_ss
 
         assert hasattr(m.fs, "is_flowsheet")
         assert m.fs.is_flowsheet()
 
     @pytest.mark.unit
-    def test_flowsheet(self):
+    def test_flowsheet(self, base_fs_ss):
         # Should return None
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock()
+        m = base_fs_ss
 
         assert m.fs.flowsheet() is None
 
     @pytest.mark.unit
-    def test_default(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock()
+    def test_default(self, base_fs_ss):
+        m = base_fs_ss
 
         assert m.fs.config.dynamic is False
         assert isinstance(m.fs.time, Set)
@@ -185,9 +191,7 @@ class TestBuild(object):
 
         assert m.fs.config.dynamic is False
         assert isinstance(m.fs.time, Set)
-        for t in m.fs.time:
-            assert t in [1, 2, 3]
-        assert len(m.fs.time) == 3
+        assert set(m.fs.time) == {1, 2, 3}
         assert m.fs.config.time is m.fs.time
         assert m.fs.time_units is None
 
@@ -198,8 +202,7 @@ class TestBuild(object):
 
         assert m.fs.config.dynamic is True
         assert isinstance(m.fs.time, ContinuousSet)
-        for t in m.fs.time:
-            assert t in [0, 1]
+        assert set(m.fs.time) == {0, 1}
         assert m.fs.config.time is m.fs.time
         assert m.fs.time_units == units.s
 
@@ -210,8 +213,7 @@ class TestBuild(object):
 
         assert m.fs.config.dynamic is True
         assert isinstance(m.fs.time, ContinuousSet)
-        for t in m.fs.time:
-            assert t in [1, 2]
+        assert set(m.fs.time) == {1, 2}
         assert m.fs.config.time is m.fs.time
         assert m.fs.time_units == units.s
 
@@ -421,11 +423,9 @@ class TestSubFlowsheetBuild(object):
 
 class TestOther(object):
     @pytest.mark.unit
-    def test_model_checks(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(dynamic=False)
+    def test_model_checks(self, base_fs_ss):
+        m = base_fs_ss.clone()
 
-        m.fs.props = PhysicalParameterTestBlock()
         m.fs.config.default_property_package = m.fs.props
 
         m.fs.unit1 = UnitModelBlock()
@@ -435,17 +435,13 @@ class TestOther(object):
 
 class TestVisualisation(object):
     @pytest.mark.unit
-    def test_report_empty(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(dynamic=False)
-        m.fs.report()
+    def test_report_empty(self, base_fs_ss):
+        base_fs_ss.fs.report()
 
     @pytest.mark.unit
-    def test_get_stream_table_contents(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(dynamic=False)
+    def test_get_stream_table_contents(self, base_fs_ss):
+        m = base_fs_ss.clone()
 
-        m.fs.props = PhysicalParameterTestBlock()
         m.fs.config.default_property_package = m.fs.props
 
         m.fs.unit1 = Heater()
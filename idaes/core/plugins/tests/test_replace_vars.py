@@ -21,10 +21,16 @@ import idaes.core.plugins
 __author__ = "John Eslick"
 
 
+@pytest.fixture(scope="module")
+def rp():
+    # The transformation is stateless, so one instance can be shared by all
+    # tests rather than repeating the factory lookup per test.
+    return pyo.TransformationFactory("replace_variables")
+
+
 @pytest.mark.unit
-def test_1():
+def test_1(rp):
     # Test scalar variables
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.x = pyo.Var(initialize=2)
     m.y = pyo.Var(initialize=3)
@@ -43,9 +49,8 @@ def test_1():
 
 
 @pytest.mark.unit
-def test_2():
+def test_2(rp):
     # Test vector variables and sums
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.x = pyo.Var(["a", "b", "c"], initialize=2)
     m.y = pyo.Var(initialize=3)
@@ -61,9 +66,8 @@ def test_2():
 
 
 @pytest.mark.unit
-def test_3():
+def test_3(rp):
     # Test expression in constraint
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.x = pyo.Var(["a", "b", "c"], initialize=2)
     m.y = pyo.Var(initialize=3)
@@ -77,9 +81,8 @@ def test_3():
 
 
 @pytest.mark.unit
-def test_4():
+def test_4(rp):
     # Test expression in objective
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.x = pyo.Var(["a", "b", "c"], initialize=2)
     m.y = pyo.Var(initialize=3)
@@ -94,9 +97,8 @@ def test_4():
 
 
 @pytest.mark.unit
-def test_4():
+def test_4b(rp):
     # Test in a hierarchical model
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.b1 = pyo.Block()
     m.b1.b2 = pyo.Block()
@@ -117,9 +119,8 @@ def test_4():
 
 
 @pytest.mark.unit
-def test_5():
+def test_5(rp):
     # Test indexed var replace
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.b1 = pyo.Block()
     m.b1.b2 = pyo.Block()
@@ -140,9 +141,8 @@ def test_5():
 
 
 @pytest.mark.unit
-def test_6():
+def test_6(rp):
     # Test non-variable exception
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.b1 = pyo.Block()
     m.b1.b2 = pyo.Block()
@@ -157,9 +157,8 @@ def test_6():
 
 
 @pytest.mark.unit
-def test_7():
+def test_7(rp):
     # Test replace indexed by non-indexed
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.b1 = pyo.Block()
     m.b1.b2 = pyo.Block()
@@ -174,9 +173,8 @@ def test_7():
 
 
 @pytest.mark.unit
-def test_8():
+def test_8(rp):
     # Test replace indexed by indexed var that doesn't have enough/right indexes
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.b1 = pyo.Block()
     m.b1.b2 = pyo.Block()
@@ -188,9 +186,8 @@ def test_8():
 
 
 @pytest.mark.unit
-def test_9():
+def test_9(rp):
     # test with references the way we handle time indexing a lot in IDAES
-    rp = pyo.TransformationFactory("replace_variables")
     block_set = {1, 2, 3}
     m = pyo.ConcreteModel()
     m.b1 = pyo.Block(block_set)
@@ -211,9 +208,8 @@ def test_9():
 
 
 @pytest.mark.unit
-def test_10():
+def test_10(rp):
     # test with more than one variable in the list
-    rp = pyo.TransformationFactory("replace_variables")
     m = pyo.ConcreteModel()
     m.x = pyo.Var(["a", "b", "c"], initialize=2)
     m.a = pyo.Var(initialize=5)
@@ -160,7 +160,9 @@ def create_stream_table_dataframe(
 
     stream_attributes = OrderedDict()
     stream_states = stream_states_dict(streams=streams, time_point=time_point)
-    full_keys = []  # List of all rows in dataframe to fill in missing data
+    # All rows in dataframe, used to fill in missing data. Dict keys are used
+    # rather than a list so membership checks are O(1) whilst preserving order.
+    full_keys = {}
 
     stream_attributes["Units"] = {}
 
@@ -177,15 +179,12 @@ def create_stream_table_dataframe(
                 stream_attributes[key][stream_key] = quant.m
                 if row == 0 or stream_key not in stream_attributes["Units"]:
                     stream_attributes["Units"][stream_key] = quant.u
-                if stream_key not in full_keys:
-                    full_keys.append(stream_key)
+                full_keys[stream_key] = None
 
     # Check for missing rows in any stream, and fill with "-" if needed
-    for k, v in stream_attributes.items():
+    for v in stream_attributes.values():
         for r in full_keys:
-            if r not in v.keys():
-                # Missing row, fill with placeholder
-                v[r] = "-"
+            v.setdefault(r, "-")
 
     return DataFrame.from_dict(stream_attributes, orient=orient)
 
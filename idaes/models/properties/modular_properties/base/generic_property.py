@@ -1001,6 +1001,22 @@ class GenericParameterData(PhysicalParameterBlock):
                         )
                 v[i].fix()
 
+        # Cache static index tuples for the state definitions. These sets are
+        # iterated by every state block built from this parameter block, and
+        # tuple iteration avoids the ordered Set machinery each time. The
+        # component tuple must match the component_list the state blocks see,
+        # which for electrolyte systems is the true or apparent species set.
+        self._phase_tuple = tuple(self.phase_list)
+        if not self._electrolyte:
+            self._comp_tuple = tuple(self.component_list)
+        elif self.config.state_components == StateIndex.true:
+            self._comp_tuple = tuple(self.true_species_set)
+        else:
+            self._comp_tuple = tuple(self.apparent_species_set)
+        # Equal-split initializer values shared by all state blocks
+        self._inv_phase_count = 1.0 / len(self._phase_tuple)
+        self._inv_comp_count = 1.0 / len(self._comp_tuple)
+
         self.config.state_definition.set_metadata(self)
 
         # Set default scaling factors
@@ -58,8 +58,10 @@ from idaes.models.properties.modular_properties.pure import NIST
 from idaes.models.properties.modular_properties.state_definitions import FTPx
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def frame():
+    # Module scoped for speed. Tests which set any of the config values
+    # below are responsible for restoring them to None before returning.
     m = Block(concrete=True)
     m.params = Block()
     m.params.config = ConfigBlock()
@@ -122,14 +124,17 @@ class TestGetMethod:
     @pytest.mark.unit
     def test_get_method_not_callable(self, frame):
         frame.params.config.test_arg = "foo"
-        with pytest.raises(
-            ConfigurationError,
-            match="ScalarBlock Generic Property Package received "
-            "invalid value for argument test_arg. Value must be a "
-            "method, a class with a method named expression or a "
-            "module containing one of the previous.",
-        ):
-            get_method(frame, "test_arg")
+        try:
+            with pytest.raises(
+                ConfigurationError,
+                match="ScalarBlock Generic Property Package received "
+                "invalid value for argument test_arg. Value must be a "
+                "method, a class with a method named expression or a "
+                "module containing one of the previous.",
+            ):
+                get_method(frame, "test_arg")
+        finally:
+            frame.params.config.test_arg = None
 
     @pytest.mark.unit
     def test_get_method_simple(self, frame):
@@ -138,8 +143,11 @@ class TestGetMethod:
 
         frame.params.config.test_arg = test_arg
 
-        mthd = get_method(frame, "test_arg")
-        assert mthd() == "bar"
+        try:
+            mthd = get_method(frame, "test_arg")
+            assert mthd() == "bar"
+        finally:
+            frame.params.config.test_arg = None
 
     @pytest.mark.unit
     def test_get_method_class_w_method(self, frame):
@@ -149,8 +157,11 @@ class TestGetMethod:
 
         frame.params.config.test_arg = TestClass
 
-        mthd = get_method(frame, "test_arg")
-        assert mthd() == "bar"
+        try:
+            mthd = get_method(frame, "test_arg")
+            assert mthd() == "bar"
+        finally:
+            frame.params.config.test_arg = None
 
     @pytest.mark.unit
     def test_get_method_class_w_return_expression(self, frame):
@@ -160,8 +171,11 @@ class TestGetMethod:
 
         frame.params.config.test_arg = TestClass
 
-        mthd = get_method(frame, "test_arg")
-        assert mthd() == "bar"
+        try:
+            mthd = get_method(frame, "test_arg")
+            assert mthd() == "bar"
+        finally:
+            frame.params.config.test_arg = None
 
     @pytest.mark.unit
     def test_get_method_phase(self, frame):
@@ -170,8 +184,11 @@ class TestGetMethod:
 
         frame.params.config.test_arg = {"test_phase": test_arg}
 
-        mthd = get_method(frame, "test_arg", phase="test_phase")
-        assert mthd() == "bar"
+        try:
+            mthd = get_method(frame, "test_arg", phase="test_phase")
+            assert mthd() == "bar"
+        finally:
+            frame.params.config.test_arg = None
 
     @pytest.mark.unit
     def test_get_method_comp(self, frame):
@@ -180,8 +197,11 @@ class TestGetMethod:
 
         frame.params.comp.config.test_arg_2 = test_arg
 
-        mthd = get_method(frame, "test_arg_2", comp="comp")
-        assert mthd() == "bar"
+        try:
+            mthd = get_method(frame, "test_arg_2", comp="comp")
+            assert mthd() == "bar"
+        finally:
+            frame.params.comp.config.test_arg_2 = None
 
     @pytest.mark.unit
     def test_get_method_phase_comp(self, frame):
@@ -190,8 +210,11 @@ class TestGetMethod:
 
         frame.params.comp.config.test_arg_2 = {"test_phase": test_arg}
 
-        mthd = get_method(frame, "test_arg_2", comp="comp", phase="test_phase")
-        assert mthd() == "bar"
+        try:
+            mthd = get_method(frame, "test_arg_2", comp="comp", phase="test_phase")
+            assert mthd() == "bar"
+        finally:
+            frame.params.comp.config.test_arg_2 = None
 
 
 class TestGetPhaseMethod:
@@ -220,14 +243,17 @@ class TestGetPhaseMethod:
     @pytest.mark.unit
     def test_get_phase_method_not_callable(self, frame):
         frame.params.comp.config.test_arg_2 = "foo"
-        with pytest.raises(
-            ConfigurationError,
-            match="ScalarBlock Generic Property Package received "
-            "invalid value for argument test_arg_2. Value must be a "
-            "method, a class with a method named expression or a "
-            "module containing one of the previous.",
-        ):
-            get_phase_method(frame, "test_arg_2", "comp")
+        try:
+            with pytest.raises(
+                ConfigurationError,
+                match="ScalarBlock Generic Property Package received "
+                "invalid value for argument test_arg_2. Value must be a "
+                "method, a class with a method named expression or a "
+                "module containing one of the previous.",
+            ):
+                get_phase_method(frame, "test_arg_2", "comp")
+        finally:
+            frame.params.comp.config.test_arg_2 = None
 
     @pytest.mark.unit
     def test_get_phase_method_simple(self, frame):
@@ -236,8 +262,11 @@ class TestGetPhaseMethod:
 
         frame.params.comp.config.test_arg_2 = test_arg
 
-        mthd = get_phase_method(frame, "test_arg_2", "comp")
-        assert mthd() == "bar"
+        try:
+            mthd = get_phase_method(frame, "test_arg_2", "comp")
+            assert mthd() == "bar"
+        finally:
+            frame.params.comp.config.test_arg_2 = None
 
     @pytest.mark.unit
     def test_get_phase_method_class_w_method(self, frame):
@@ -247,8 +276,11 @@ class TestGetPhaseMethod:
 
         frame.params.comp.config.test_arg_2 = TestClass
 
-        mthd = get_phase_method(frame, "test_arg_2", "comp")
-        assert mthd() == "bar"
+        try:
+            mthd = get_phase_method(frame, "test_arg_2", "comp")
+            assert mthd() == "bar"
+        finally:
+            frame.params.comp.config.test_arg_2 = None
 
     @pytest.mark.unit
     def test_get_phase_method_class_w_return_expression(self, frame):
@@ -258,8 +290,11 @@ class TestGetPhaseMethod:
 
         frame.params.comp.config.test_arg_2 = TestClass
 
-        mthd = get_phase_method(frame, "test_arg_2", "comp")
-        assert mthd() == "bar"
+        try:
+            mthd = get_phase_method(frame, "test_arg_2", "comp")
+            assert mthd() == "bar"
+        finally:
+            frame.params.comp.config.test_arg_2 = None
 
 
 class TestGetBoundsFromConfig:
@@ -273,18 +308,24 @@ class TestGetBoundsFromConfig:
     @pytest.mark.unit
     def test_no_state_bounds_3(self, frame):
         frame.params.config.state_bounds = {"test_state": (1, 2, 3)}
-        bounds, value = get_bounds_from_config(frame, "test_state", "bar")
+        try:
+            bounds, value = get_bounds_from_config(frame, "test_state", "bar")
 
-        assert bounds == (1, 3)
-        assert value == 2
+            assert bounds == (1, 3)
+            assert value == 2
+        finally:
+            frame.params.config.state_bounds = None
 
     @pytest.mark.unit
     def test_no_state_bounds_4(self, frame):
         frame.params.config.state_bounds = {"test_state": (1, 2, 3, pyunits.km)}
-        bounds, value = get_bounds_from_config(frame, "test_state", pyunits.m)
+        try:
+            bounds, value = get_bounds_from_config(frame, "test_state", pyunits.m)
 
-        assert bounds == (1000, 3000)
-        assert value == 2000
+            assert bounds == (1000, 3000)
+            assert value == 2000
+        finally:
+            frame.params.config.state_bounds = None
 
 
 class TestGetConcentrationTerm:
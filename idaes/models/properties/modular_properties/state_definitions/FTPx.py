@@ -25,6 +25,7 @@ from pyomo.environ import (
     Constraint,
     Expression,
     NonNegativeReals,
+    quicksum,
     Var,
     value,
     units as pyunits,
@@ -59,6 +60,12 @@ def set_metadata(b):
     pass
 
 
+def _sum_mole_frac_out_rule(b):
+    # Defined at module level so all outlet state blocks share a single
+    # function object rather than rebuilding an identical closure each time
+    return 1.0 == quicksum(b.mole_frac_comp[i] for i in b.params._comp_tuple)
+
+
 def define_state(b):
     # FTPx formulation always requires a flash, so set flag to True
     # TODO: should have some checking to make sure developers implement this properly
@@ -66,6 +73,17 @@ def define_state(b):
 
     units = b.params.get_metadata().derived_units
 
+    # Resolve the indexing sets once; they are dereferenced repeatedly in
+    # the declarations and rules below, and attribute lookups on the block
+    # are comparatively expensive during constraint construction.
+    phase_list = b.phase_list
+    component_list = b.component_list
+    phase_component_set = b.phase_component_set
+    # Static index tuples precomputed on the parameter block; prefer these
+    # for iteration in the rules below.
+    phases = b.params._phase_tuple
+    comps = b.params._comp_tuple
+
     # Check that only necessary state_bounds are defined
     expected_keys = ["flow_mol", "temperature", "pressure"]
     if (
@@ -102,9 +120,9 @@ def define_state(b):
         units=units.FLOW_MOLE,
     )
     b.mole_frac_comp = Var(
-        b.component_list,
+        component_list,
         bounds=(1e-20, 1.001),
-        initialize=1 / len(b.component_list),
+        initialize=b.params._inv_comp_count,
         doc="Mixture mole fractions",
         units=pyunits.dimensionless,
     )
@@ -127,10 +145,10 @@ def define_state(b):
     if f_init is None:
         fp_init = None
     else:
-        fp_init = f_init / len(b.phase_list)
+        fp_init = f_init / len(phases)
 
     b.flow_mol_phase = Var(
-        b.phase_list,
+        phase_list,
         initialize=fp_init,
         domain=NonNegativeReals,
         bounds=f_bounds,
@@ -139,8 +157,8 @@ def define_state(b):
     )
 
     b.mole_frac_phase_comp = Var(
-        b.phase_component_set,
-        initialize=1 / len(b.component_list),
+        phase_component_set,
+        initialize=b.params._inv_comp_count,
         bounds=(1e-20, 1.001),
         doc="Phase mole fractions",
         units=pyunits.dimensionless,
@@ -150,12 +168,12 @@ def define_state(b):
         return b.flow_mol_phase[p] * b.mole_frac_phase_comp[p, j]
 
     b.flow_mol_phase_comp = Expression(
-        b.phase_component_set, rule=Fpc_expr, doc="Phase-component molar flowrates"
+        phase_component_set, rule=Fpc_expr, doc="Phase-component molar flowrates"
     )
 
     b.phase_frac = Var(
-        b.phase_list,
-        initialize=1.0 / len(b.phase_list),
+        phase_list,
+        initialize=b.params._inv_phase_count,
         bounds=(0, None),
         doc="Phase fractions",
         units=pyunits.dimensionless,
@@ -168,60 +186,59 @@ def define_state(b):
     # Add supporting constraints
     if b.config.defined_state is False:
         # applied at outlet only
-        b.sum_mole_frac_out = Constraint(
-            expr=1.0 == sum(b.mole_frac_comp[i] for i in b.component_list)
-        )
+        b.sum_mole_frac_out = Constraint(rule=_sum_mole_frac_out_rule)
 
-    if len(b.phase_list) == 1:
+    if len(phase_list) == 1:
+        p1 = phases[0]
 
         def rule_total_mass_balance(b):
-            return b.flow_mol_phase[b.phase_list.first()] == b.flow_mol
+            return b.flow_mol_phase[p1] == b.flow_mol
 
         b.total_flow_balance = Constraint(rule=rule_total_mass_balance)
 
         def rule_comp_mass_balance(b, i):
-            return (
-                b.mole_frac_comp[i] == b.mole_frac_phase_comp[b.phase_list.first(), i]
-            )
+            return b.mole_frac_comp[i] == b.mole_frac_phase_comp[p1, i]
 
         b.component_flow_balances = Constraint(
-            b.component_list, rule=rule_comp_mass_balance
+            component_list, rule=rule_comp_mass_balance
         )
 
         def rule_phase_frac(b, p):
             return b.phase_frac[p] == 1.0
 
-        b.phase_fraction_constraint = Constraint(b.phase_list, rule=rule_phase_frac)
+        b.phase_fraction_constraint = Constraint(phase_list, rule=rule_phase_frac)
 
-    elif len(b.phase_list) == 2:
+    elif len(phase_list) == 2:
         # For two phase, use Rachford-Rice formulation
+        p1, p2 = phases
+
         def rule_total_mass_balance(b):
-            return sum(b.flow_mol_phase[p] for p in b.phase_list) == b.flow_mol
+            return quicksum(b.flow_mol_phase[p] for p in phases) == b.flow_mol
 
         b.total_flow_balance = Constraint(rule=rule_total_mass_balance)
 
         def rule_comp_mass_balance(b, i):
-            return b.flow_mol * b.mole_frac_comp[i] == sum(
+            return b.flow_mol * b.mole_frac_comp[i] == quicksum(
                 b.flow_mol_phase[p] * b.mole_frac_phase_comp[p, i]
-                for p in b.phase_list
-                if (p, i) in b.phase_component_set
+                for p in phases
+                if (p, i) in phase_component_set
             )
 
         b.component_flow_balances = Constraint(
-            b.component_list, rule=rule_comp_mass_balance
+            component_list, rule=rule_comp_mass_balance
         )
 
         def rule_mole_frac(b):
             return (
-                sum(
-                    b.mole_frac_phase_comp[b.phase_list.first(), i]
-                    for i in b.component_list
-                    if (b.phase_list.first(), i) in b.phase_component_set
+                quicksum(
+                    b.mole_frac_phase_comp[p1, i]
+                    for i in comps
+                    if (p1, i) in phase_component_set
                 )
-                - sum(
-                    b.mole_frac_phase_comp[b.phase_list.last(), i]
-                    for i in b.component_list
-                    if (b.phase_list.last(), i) in b.phase_component_set
+                - quicksum(
+                    b.mole_frac_phase_comp[p2, i]
+                    for i in comps
+                    if (p2, i) in phase_component_set
                 )
                 == 0
             )
@@ -231,139 +248,151 @@ def define_state(b):
         def rule_phase_frac(b, p):
             return b.phase_frac[p] * b.flow_mol == b.flow_mol_phase[p]
 
-        b.phase_fraction_constraint = Constraint(b.phase_list, rule=rule_phase_frac)
+        b.phase_fraction_constraint = Constraint(phase_list, rule=rule_phase_frac)
 
     else:
         # Otherwise use a general formulation
         def rule_comp_mass_balance(b, i):
-            return b.flow_mol * b.mole_frac_comp[i] == sum(
+            return b.flow_mol * b.mole_frac_comp[i] == quicksum(
                 b.flow_mol_phase[p] * b.mole_frac_phase_comp[p, i]
-                for p in b.phase_list
-                if (p, i) in b.phase_component_set
+                for p in phases
+                if (p, i) in phase_component_set
             )
 
         b.component_flow_balances = Constraint(
-            b.component_list, rule=rule_comp_mass_balance
+            component_list, rule=rule_comp_mass_balance
         )
 
         def rule_mole_frac(b, p):
             return (
-                sum(
+                quicksum(
                     b.mole_frac_phase_comp[p, i]
-                    for i in b.component_list
-                    if (p, i) in b.phase_component_set
+                    for i in comps
+                    if (p, i) in phase_component_set
                 )
                 == 1
             )
 
-        b.sum_mole_frac = Constraint(b.phase_list, rule=rule_mole_frac)
+        b.sum_mole_frac = Constraint(phase_list, rule=rule_mole_frac)
 
         def rule_phase_frac(b, p):
             return b.phase_frac[p] * b.flow_mol == b.flow_mol_phase[p]
 
-        b.phase_fraction_constraint = Constraint(b.phase_list, rule=rule_phase_frac)
+        b.phase_fraction_constraint = Constraint(phase_list, rule=rule_phase_frac)
 
     # -------------------------------------------------------------------------
     # General Methods
-    def get_material_flow_terms_FTPx(b, p, j):
-        """Create material flow terms for control volume."""
-        return b.flow_mol_phase_comp[p, j]
-
+    # define_state_vars is called repeatedly during port construction and
+    # initialization and its membership never changes, so build the dict
+    # once here and have the bound method return it directly.
+    b._state_vars_dict = {
+        "flow_mol": b.flow_mol,
+        "mole_frac_comp": b.mole_frac_comp,
+        "temperature": b.temperature,
+        "pressure": b.pressure,
+    }
+
+    # These are defined at module level so all state blocks share a single
+    # function object, and bound to the block here.
     b.get_material_flow_terms = MethodType(get_material_flow_terms_FTPx, b)
+    b.get_enthalpy_flow_terms = MethodType(get_enthalpy_flow_terms_FTPx, b)
+    b.get_material_density_terms = MethodType(get_material_density_terms_FTPx, b)
+    b.get_energy_density_terms = MethodType(get_energy_density_terms_FTPx, b)
+    b.default_material_balance_type = default_material_balance_type_FTPx
+    b.default_energy_balance_type = default_energy_balance_type_FTPx
+    b.get_material_flow_basis = get_material_flow_basis_FTPx
+    b.define_state_vars = MethodType(define_state_vars_FTPx, b)
+    b.define_display_vars = MethodType(define_display_vars_FTPx, b)
 
-    def get_enthalpy_flow_terms_FTPx(b, p):
-        """Create enthalpy flow terms."""
-        # enth_mol_phase probably does not exist when this is created
-        # Use try/except to build flow term if not present
-        try:
-            eflow = b._enthalpy_flow_term
-        except AttributeError:
 
-            def rule_eflow(b, p):
-                return b.flow_mol_phase[p] * b.enth_mol_phase[p]
+def get_material_flow_terms_FTPx(b, p, j):
+    """Create material flow terms for control volume."""
+    return b.flow_mol_phase_comp[p, j]
 
-            eflow = b._enthalpy_flow_term = Expression(b.phase_list, rule=rule_eflow)
-        return eflow[p]
 
-    b.get_enthalpy_flow_terms = MethodType(get_enthalpy_flow_terms_FTPx, b)
+def get_enthalpy_flow_terms_FTPx(b, p):
+    """Create enthalpy flow terms."""
+    # enth_mol_phase probably does not exist when this is created
+    # Use try/except to build flow term if not present
+    try:
+        eflow = b._enthalpy_flow_term
+    except AttributeError:
 
-    def get_material_density_terms_FTPx(b, p, j):
-        """Create material density terms."""
-        # dens_mol_phase probably does not exist when this is created
-        # Use try/except to build term if not present
-        try:
-            mdens = b._material_density_term
-        except AttributeError:
+        def rule_eflow(b, p):
+            return b.flow_mol_phase[p] * b.enth_mol_phase[p]
 
-            def rule_mdens(b, p, j):
-                return b.dens_mol_phase[p] * b.mole_frac_phase_comp[p, j]
+        eflow = b._enthalpy_flow_term = Expression(b.phase_list, rule=rule_eflow)
+    return eflow[p]
 
-            mdens = b._material_density_term = Expression(
-                b.phase_component_set, rule=rule_mdens
-            )
-        return mdens[p, j]
 
-    b.get_material_density_terms = MethodType(get_material_density_terms_FTPx, b)
+def get_material_density_terms_FTPx(b, p, j):
+    """Create material density terms."""
+    # dens_mol_phase probably does not exist when this is created
+    # Use try/except to build term if not present
+    try:
+        mdens = b._material_density_term
+    except AttributeError:
 
-    def get_energy_density_terms_FTPx(b, p):
-        """Create energy density terms."""
-        # Density and energy terms probably do not exist when this is created
-        # Use try/except to build term if not present
-        try:
-            edens = b._energy_density_term
-        except AttributeError:
+        def rule_mdens(b, p, j):
+            return b.dens_mol_phase[p] * b.mole_frac_phase_comp[p, j]
 
-            def rule_edens(b, p):
-                return b.dens_mol_phase[p] * b.energy_internal_mol_phase[p]
+        mdens = b._material_density_term = Expression(
+            b.phase_component_set, rule=rule_mdens
+        )
+    return mdens[p, j]
 
-            edens = b._energy_density_term = Expression(b.phase_list, rule=rule_edens)
-        return edens[p]
 
-    b.get_energy_density_terms = MethodType(get_energy_density_terms_FTPx, b)
+def get_energy_density_terms_FTPx(b, p):
+    """Create energy density terms."""
+    # Density and energy terms probably do not exist when this is created
+    # Use try/except to build term if not present
+    try:
+        edens = b._energy_density_term
+    except AttributeError:
 
-    def default_material_balance_type_FTPx():
-        return MaterialBalanceType.componentTotal
+        def rule_edens(b, p):
+            return b.dens_mol_phase[p] * b.energy_internal_mol_phase[p]
 
-    b.default_material_balance_type = default_material_balance_type_FTPx
+        edens = b._energy_density_term = Expression(b.phase_list, rule=rule_edens)
+    return edens[p]
 
-    def default_energy_balance_type_FTPx():
-        return EnergyBalanceType.enthalpyTotal
 
-    b.default_energy_balance_type = default_energy_balance_type_FTPx
+def default_material_balance_type_FTPx():
+    return MaterialBalanceType.componentTotal
 
-    def get_material_flow_basis_FTPx():
-        return MaterialFlowBasis.molar
 
-    b.get_material_flow_basis = get_material_flow_basis_FTPx
+def default_energy_balance_type_FTPx():
+    return EnergyBalanceType.enthalpyTotal
 
-    def define_state_vars_FTPx(b):
-        """Define state vars."""
-        return {
-            "flow_mol": b.flow_mol,
-            "mole_frac_comp": b.mole_frac_comp,
-            "temperature": b.temperature,
-            "pressure": b.pressure,
-        }
 
-    b.define_state_vars = MethodType(define_state_vars_FTPx, b)
+def get_material_flow_basis_FTPx():
+    return MaterialFlowBasis.molar
 
-    def define_display_vars_FTPx(b):
-        """Define display vars."""
-        return {
-            "Total Molar Flowrate": b.flow_mol,
-            "Total Mole Fraction": b.mole_frac_comp,
-            "Temperature": b.temperature,
-            "Pressure": b.pressure,
-        }
 
-    b.define_display_vars = MethodType(define_display_vars_FTPx, b)
+def define_state_vars_FTPx(b):
+    """Define state vars."""
+    return b._state_vars_dict
+
+
+def define_display_vars_FTPx(b):
+    """Define display vars."""
+    return {
+        "Total Molar Flowrate": b.flow_mol,
+        "Total Mole Fraction": b.mole_frac_comp,
+        "Temperature": b.temperature,
+        "Pressure": b.pressure,
+    }
 
 
 def state_initialization(b):
     # Need to do sanity checking of mole fractions for ideal phase fraction
-    # calculations
+    # calculations. Read each value once here and reuse them for every phase
+    # below, rather than going through the Var accessors per (phase,
+    # component) pair.
+    mole_frac_comp_value = {}
     for j in b.component_list:
-        if value(b.mole_frac_comp[j]) < 0:
+        mole_frac_comp_value[j] = mf_j = value(b.mole_frac_comp[j])
+        if mf_j < 0:
             raise ValueError(
                 f"Component {j} has a negative "
                 f"mole fraction in block {b.name}. "
@@ -374,7 +403,7 @@ def state_initialization(b):
         # Start with phase mole fractions equal to total mole fractions
         for j in b.component_list:
             if (p, j) in b.phase_component_set:
-                b.mole_frac_phase_comp[p, j].value = b.mole_frac_comp[j].value
+                b.mole_frac_phase_comp[p, j].value = mole_frac_comp_value[j]
 
         b.flow_mol_phase[p].value = value(b.phase_frac[p] * b.flow_mol)
 
@@ -335,6 +335,16 @@ class PressureChangerData(UnitModelBlockData):
     Standard Compressor/Expander Unit Model Class
     """
 
+    # Method used to build the performance equations for each thermodynamic
+    # assumption. Names are resolved on self so subclasses can override the
+    # builder methods as usual.
+    _assumption_builders = {
+        ThermodynamicAssumption.isothermal: "add_isothermal",
+        ThermodynamicAssumption.isentropic: "add_isentropic",
+        ThermodynamicAssumption.pump: "add_pump",
+        ThermodynamicAssumption.adiabatic: "add_adiabatic",
+    }
+
     CONFIG = UnitModelBlockData.CONFIG()
 
     CONFIG.declare(
@@ -557,14 +567,9 @@ see property package for documentation.}""",
             )
 
         # Construct equations for thermodynamic assumption
-        if self.config.thermodynamic_assumption == ThermodynamicAssumption.isothermal:
-            self.add_isothermal()
-        elif self.config.thermodynamic_assumption == ThermodynamicAssumption.isentropic:
-            self.add_isentropic()
-        elif self.config.thermodynamic_assumption == ThermodynamicAssumption.pump:
-            self.add_pump()
-        elif self.config.thermodynamic_assumption == ThermodynamicAssumption.adiabatic:
-            self.add_adiabatic()
+        builder = self._assumption_builders.get(self.config.thermodynamic_assumption)
+        if builder is not None:
+            getattr(self, builder)()
 
     def add_pump(self):
         """
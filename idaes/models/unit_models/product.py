@@ -17,6 +17,7 @@ Standard IDAES Product block.
 # Import Pyomo libraries
 from pyomo.environ import Reference
 from pyomo.common.config import ConfigBlock, ConfigValue, In
+from pyomo.network import Port
 
 # Import IDAES cores
 from idaes.core import declare_process_block_class, UnitModelBlockData, useDefault
@@ -35,6 +36,125 @@ __author__ = "Andrew Lee"
 _log = idaeslog.getLogger(__name__)
 
 
+def _member_signature(state_data, cache_attr, define_method):
+    """
+    Get a member signature for a state block data object.
+
+    The signature is a tuple of (name, local_name, is_indexed) entries, one
+    per member returned by define_method. Both sets are fixed by the property
+    package, so the signature is cached as an attribute on the associated
+    property parameter block; repeated Product constructions using the same
+    package then avoid redundant member enumeration, and the cache shares the
+    lifetime of the package rather than pinning it in a process-global map.
+
+    Args:
+        state_data: a StateBlockData object to interrogate on first call
+        cache_attr: name of the parameter block attribute in which to
+            memoize the signature
+        define_method: name of the method enumerating members, e.g.
+            "define_state_vars"
+
+    Returns:
+        tuple of (name, local_name, is_indexed) tuples
+    """
+    params = state_data.params
+    try:
+        return getattr(params, cache_attr)
+    except AttributeError:
+        members = getattr(state_data, define_method)()
+        sig = tuple((s, v.local_name, v.is_indexed()) for s, v in members.items())
+        setattr(params, cache_attr, sig)
+        return sig
+
+
+def _state_var_signature(state_data):
+    """Get the memoized define_state_vars signature for a state block data."""
+    return _member_signature(
+        state_data, "_state_var_signature_cache", "define_state_vars"
+    )
+
+
+def _collect_ref_maps(properties, sig):
+    """
+    Collect index to ComponentData maps for all members in sig.
+
+    Rather than flattening one slice per member (each of which walks the
+    time index and component index sets separately), this walks the state
+    block data once, accumulating a map per member suitable for passing to
+    Reference.
+
+    Args:
+        properties: indexed StateBlock to walk
+        sig: member signature from _member_signature
+
+    Returns:
+        dict mapping member name to an index to ComponentData dict
+    """
+    ref_maps = {s: {} for s, _, _ in sig}
+    for t, sdata in properties.items():
+        for s, l_name, indexed in sig:
+            comp = sdata.component(l_name)
+            if indexed:
+                s_map = ref_maps[s]
+                for idx, vdata in comp.items():
+                    if idx.__class__ is tuple:
+                        s_map[(t,) + idx] = vdata
+                    else:
+                        s_map[(t, idx)] = vdata
+            else:
+                ref_maps[s][t] = comp
+
+    return ref_maps
+
+
+def _add_state_var_references(blk, properties, sig):
+    """
+    Add references to all state variables on a block in a single pass.
+
+    Args:
+        blk: block to which references should be attached
+        properties: indexed StateBlock to reference
+        sig: state variable signature from _state_var_signature
+
+    Returns:
+        None
+    """
+    ref_maps = _collect_ref_maps(properties, sig)
+    for s, _, _ in sig:
+        setattr(blk, s, Reference(ref_maps[s]))
+
+
+def _add_inlet_port(blk, properties):
+    """
+    Specialized version of UnitModelBlockData.add_port for Product blocks.
+
+    Product blocks always attach a single Port named "inlet" directly to
+    their state block, so the generic introspection in add_port/build_port
+    can be replaced by the same memoized signature and single-pass walk
+    used for the state variable references.
+
+    Args:
+        blk: ProductData block to which the Port should be attached
+        properties: indexed StateBlock to use as the source for the Port
+
+    Returns:
+        None
+    """
+    sig = _member_signature(
+        properties[properties.index_set().first()],
+        "_port_member_signature_cache",
+        "define_port_members",
+    )
+    ref_maps = _collect_ref_maps(properties, sig)
+
+    port = Port(doc="Inlet Port")
+    blk.add_component("inlet", port)
+    for s, _, _ in sig:
+        ref = Reference(ref_maps[s])
+        blk.add_component(properties.get_port_reference_name(s, "inlet"), ref)
+        port.add(ref, s)
+
+
 @declare_process_block_class("Product")
 class ProductData(UnitModelBlockData):
     """
@@ -118,19 +238,11 @@ see property package for documentation.}""",
         )
 
         # Add references to all state vars
-        s_vars = self.properties[self.flowsheet().time.first()].define_state_vars()
-        for s in s_vars:
-            l_name = s_vars[s].local_name
-            if s_vars[s].is_indexed():
-                slicer = self.properties[:].component(l_name)[...]
-            else:
-                slicer = self.properties[:].component(l_name)
-
-            r = Reference(slicer)
-            setattr(self, s, r)
+        s_vars = _state_var_signature(self.properties[self.flowsheet().time.first()])
+        _add_state_var_references(self, self.properties, s_vars)
 
         # Add outlet port
-        self.add_port(name="inlet", block=self.properties, doc="Inlet Port")
+        _add_inlet_port(self, self.properties)
 
     def initialize_build(
         blk, state_args=None, outlvl=idaeslog.NOTSET, solver=None, optarg=None
@@ -155,11 +267,34 @@ see property package for documentation.}""",
         # ---------------------------------------------------------------------
         # Initialize state block
         init_log = idaeslog.getInitLogger(blk.name, outlvl, tag="unit")
+
+        # Skip the state block solve if nothing has changed since the last
+        # initialization (e.g. repeated passes of a sequential-modular
+        # flowsheet initialization scheme). Explicit state_args always force
+        # a full initialization, as they may differ from the current state.
+        if (
+            state_args is None
+            and getattr(blk, "_last_init_hash", None) == blk._state_var_hash()
+        ):
+            init_log.info("Initialization skipped - state unchanged.")
+            return
+
         blk.properties.initialize(
             outlvl=outlvl, optarg=optarg, solver=solver, state_args=state_args
         )
+        blk._last_init_hash = blk._state_var_hash()
         init_log.info("Initialization Complete.")
 
+    def _state_var_hash(blk):
+        """Tuple of current state variable values, used to detect whether
+        anything has changed between calls to initialize_build."""
+        return tuple(
+            vd.value
+            for t in blk.properties
+            for v in blk.properties[t].define_state_vars().values()
+            for vd in v.values()
+        )
+
     def _get_stream_table_contents(self, time_point=0):
         return create_stream_table_dataframe(
             {"Inlet": self.inlet}, time_point=time_point
@@ -1728,73 +1728,70 @@ class MEAColumnData(PackedColumnData):
 
         initial_dof = degrees_of_freedom(blk)
 
+        # Constraint handles are captured directly, so the (de)activation
+        # loops below need neither getattr lookups nor a walk of every
+        # Constraint in the subtree
         unit_constraints = [
-            "pressure_at_interface",
-            "interphase_mass_transfer_eqn",
-            "liquid_mass_transfer_eqn",
-            "vapor_mass_transfer_eqn",
-            "Ack_intermediate_eqn",
-            "heat_transfer_coeff_eqn",
-            "heat_transfer_eqn1",
-            "heat_transfer_eqn2",
-            "enthalpy_transfer_eqn1",
-            "enthalpy_transfer_eqn2",
+            blk.pressure_at_interface,
+            blk.interphase_mass_transfer_eqn,
+            blk.liquid_mass_transfer_eqn,
+            blk.vapor_mass_transfer_eqn,
+            blk.heat_transfer_coeff_eqn,
+            blk.heat_transfer_eqn1,
+            blk.heat_transfer_eqn2,
+            blk.enthalpy_transfer_eqn1,
+            blk.enthalpy_transfer_eqn2,
         ]
 
         interfacial_area_constraints = [
-            "area_interfacial_eqn",
-            "log_area_interfacial_eqn",
+            blk.area_interfacial_eqn,
+            blk.log_area_interfacial_eqn,
         ]
 
         liquid_holdup_constraints = [
-            "holdup_liq_eqn",
-            "log_holdup_liq_eqn",
+            blk.holdup_liq_eqn,
+            blk.log_holdup_liq_eqn,
         ]
 
         mass_transfer_coeff_vap_constraints = [
-            "log_mass_transfer_coeff_vap_eqn",
-            "log_holdup_vap_eqn",
-            "log_Cv_ref_eqn",
-            "mass_transfer_coeff_vap_eqn",
+            blk.log_mass_transfer_coeff_vap_eqn,
+            blk.log_holdup_vap_eqn,
+            blk.log_Cv_ref_eqn,
+            blk.mass_transfer_coeff_vap_eqn,
         ]
 
         mass_transfer_coeff_liq_constraints = [
-            "log_mass_transfer_coeff_liq_eqn",
-            "log_Cl_ref_eqn",
-            "mass_transfer_coeff_liq_eqn",
+            blk.log_mass_transfer_coeff_liq_eqn,
+            blk.log_Cl_ref_eqn,
+            blk.mass_transfer_coeff_liq_eqn,
         ]
 
         heat_transfer_coefficient_constraint = [
-            "heat_transfer_coeff_base_eqn",
-            "log_heat_transfer_coeff_base_eqn",
+            blk.heat_transfer_coeff_base_eqn,
+            blk.log_heat_transfer_coeff_base_eqn,
         ]
 
         flooding_constraints = [
-            "log_flood_H_eqn",
-            "log_flow_mass_ratio_Liq_Vap_eqn",
-            "flood_H_eqn",
-            "fourth_root_flood_H_eqn",
-            "log_gas_velocity_fld_eqn",
-            "gas_velocity_fld_eqn",
-            "flood_fraction_eqn",
+            blk.log_flow_mass_ratio_Liq_Vap_eqn,
+            blk.flood_H_eqn,
+            blk.fourth_root_flood_H_eqn,
+            blk.log_gas_velocity_fld_eqn,
+            blk.gas_velocity_fld_eqn,
+            blk.flood_fraction_eqn,
         ]
 
         # ---------------------------------------------------------------------
         # Deactivate unit model level constraints
-        for c in blk.component_objects(Constraint, descend_into=True):
-            if c.local_name in unit_constraints:
-                c.deactivate()
-            if c.local_name in interfacial_area_constraints:
-                c.deactivate()
-            if c.local_name in liquid_holdup_constraints:
-                c.deactivate()
-            if c.local_name in mass_transfer_coeff_vap_constraints:
-                c.deactivate()
-            if c.local_name in mass_transfer_coeff_liq_constraints:
-                c.deactivate()
-            if c.local_name in heat_transfer_coefficient_constraint:
-                c.deactivate()
-            if c.local_name in flooding_constraints:
+        for group in (
+            unit_constraints,
+            interfacial_area_constraints,
+            liquid_holdup_constraints,
+            mass_transfer_coeff_vap_constraints,
+            mass_transfer_coeff_liq_constraints,
+            heat_transfer_coefficient_constraint,
+            flooding_constraints,
+        ):
+            for c in group:
                 c.deactivate()
 
         for constraint in blk.enhancement_factor_constraints:
@@ -2066,7 +2063,7 @@ class MEAColumnData(PackedColumnData):
         )
 
         for c in liquid_holdup_constraints:
-            getattr(blk, c).activate()
+            c.activate()
 
         blk.log_holdup_liq.unfix()
         blk.holdup_liq.unfix()
@@ -2098,7 +2095,7 @@ class MEAColumnData(PackedColumnData):
         blk.mass_transfer_coeff_vap.unfix()
 
         for c in mass_transfer_coeff_vap_constraints:
-            getattr(blk, c).activate()
+            c.activate()
 
         for t in blk.flowsheet().time:
             for x in blk.vapor_phase.length_domain:
@@ -2139,7 +2136,7 @@ class MEAColumnData(PackedColumnData):
         blk.mass_transfer_coeff_liq.unfix()
 
         for c in mass_transfer_coeff_liq_constraints:
-            getattr(blk, c).activate()
+            c.activate()
 
         for t in blk.flowsheet().time:
             for x in blk.liquid_phase.length_domain:
@@ -836,9 +836,10 @@ and used when constructing these
 
         # ---------------------------------------------------------------------
         # Deactivate unit model level constraints
-        for c in blk.component_objects(Constraint, descend_into=True):
-            if c.local_name in unit_constraints:
-                c.deactivate()
+        # These are all declared directly on this block, so they can be looked
+        # up by name instead of walking every Constraint in the subtree
+        for name in unit_constraints:
+            getattr(blk, name).deactivate()
 
         # Fix variables
 
@@ -103,13 +103,16 @@ class HelmIsentropicCompressorData(BalanceBlockData):
         _assert_properties(config.property_package)
         te = ThermoExpr(blk=self, parameters=config.property_package)
 
+        # Resolve the time domain once rather than per component below
+        time = self.flowsheet().time
+
         eff = self.efficiency_isentropic = pyo.Var(
-            self.flowsheet().time, initialize=0.9, doc="Isentropic efficiency"
+            time, initialize=0.9, doc="Isentropic efficiency"
         )
         eff.fix()
 
         pratio = self.ratioP = pyo.Var(
-            self.flowsheet().time,
+            time,
             initialize=1.5,
             doc="Ratio of outlet to inlet pressure",
         )
@@ -118,34 +121,32 @@ class HelmIsentropicCompressorData(BalanceBlockData):
         properties_in = self.control_volume.properties_in
         properties_out = self.control_volume.properties_out
 
-        @self.Expression(
-            self.flowsheet().time, doc="isentropic outlet enthalpy expression"
-        )
+        @self.Expression(time, doc="isentropic outlet enthalpy expression")
         def h_is(b, t):
             return te.h(s=properties_in[t].entr_mol, p=properties_out[t].pressure)
 
-        @self.Expression(self.flowsheet().time, doc="isentropic work expression")
+        @self.Expression(time, doc="isentropic work expression")
         def work_isentropic(b, t):
             return properties_in[t].flow_mol * (
                 properties_in[t].enth_mol - self.h_is[t]
             )
 
-        @self.Expression(self.flowsheet().time, doc="outlet enthalpy expression")
+        @self.Expression(time, doc="outlet enthalpy expression")
         def h_o(b, t):  # Early access to the outlet enthalpy and work
             return (
                 properties_in[t].enth_mol
                 + (self.h_is[t] - properties_in[t].enth_mol) / eff[t]
             )
 
-        @self.Constraint(self.flowsheet().time)
+        @self.Constraint(time)
         def eq_work(b, t):  # Work from energy balance
             return properties_out[t].enth_mol == self.h_o[t]
 
-        @self.Constraint(self.flowsheet().time)
+        @self.Constraint(time)
         def eq_pressure_ratio(b, t):
             return pratio[t] * properties_in[t].pressure == properties_out[t].pressure
 
-        @self.Expression(self.flowsheet().time)
+        @self.Expression(time)
         def work_mechanical(b, t):
             return b.control_volume.work[t]
 
@@ -169,8 +170,9 @@ class HelmIsentropicCompressorData(BalanceBlockData):
         # This will only restore the values of variables that were originally fixed
         sp = StoreSpec.value_isfixed_isactive(only_fixed=True)
         istate = to_json(self, return_dict=True, wts=sp)
+        time = self.flowsheet().time
         # Check for alternate pressure specs
-        for t in self.flowsheet().time:
+        for t in time:
             if self.outlet.pressure[t].fixed:
                 self.ratioP[t] = pyo.value(
                     self.outlet.pressure[t] / self.inlet.pressure[t]
@@ -188,15 +190,22 @@ class HelmIsentropicCompressorData(BalanceBlockData):
         self.ratioP.fix()
         self.deltaP.unfix()
         self.efficiency_isentropic.fix()
-        for t in self.flowsheet().time:
-            self.outlet.pressure[t] = pyo.value(self.inlet.pressure[t] * self.ratioP[t])
-            self.deltaP[t] = pyo.value(self.outlet.pressure[t] - self.inlet.pressure[t])
-            self.outlet.enth_mol[t] = pyo.value(self.h_o[t])
-            self.control_volume.work[t] = pyo.value(
-                self.inlet.flow_mol[t] * self.inlet.enth_mol[t]
-                - self.outlet.flow_mol[t] * self.outlet.enth_mol[t]
+        for t in time:
+            # Evaluate each quantity once and reuse the plain floats below.
+            # The outlet pressure must be set before evaluating h_o, which
+            # depends on it through the isentropic enthalpy expression.
+            p_in = pyo.value(self.inlet.pressure[t])
+            p_out = p_in * pyo.value(self.ratioP[t])
+            flow_in = pyo.value(self.inlet.flow_mol[t])
+            self.outlet.pressure[t] = p_out
+            self.deltaP[t] = p_out - p_in
+            h_out = pyo.value(self.h_o[t])
+            self.outlet.enth_mol[t] = h_out
+            self.control_volume.work[t] = (
+                flow_in * pyo.value(self.inlet.enth_mol[t])
+                - pyo.value(self.outlet.flow_mol[t]) * h_out
             )
-            self.outlet.flow_mol[t] = pyo.value(self.inlet.flow_mol[t])
+            self.outlet.flow_mol[t] = flow_in
         # Solve the model (should be already solved from above)
         with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
             slvr.solve(self, tee=slc.tee)
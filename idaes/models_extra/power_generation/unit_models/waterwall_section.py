@@ -427,10 +427,9 @@ constructed,
             self.flowsheet().time, doc="waterwall fluid volume of all tubes"
         )
         def volume_eqn(b, t):
-            return (
-                b.volume[t]
-                == 0.25 * const.pi * b.tube_diameter**2 * b.tube_length * b.number_tubes
-            )
+            # Reuse the cross section expression rather than rebuilding
+            # 0.25*pi*d**2*ntubes for every time point
+            return b.volume[t] == b.area_cross_fluid_total * b.tube_length
 
     def _make_performance(self):
         """